@@ -10,38 +10,104 @@
 
 import os
 import sys
-from datetime import datetime, timedelta
+import io
 import argparse
-import statistics
+from array import array
+from contextlib import ExitStack
+from functools import lru_cache
+import math
+import mmap
+import operator
 
-def format_timedelta(td):
-    """Format a timedelta object as HH:MM:SS"""
-    total_seconds = int(td.total_seconds())
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+# Byte value used when scanning raw B records
+_B = ord('B')
+
+@lru_cache(maxsize=8192)
+def format_hms(seconds):
+    """Format seconds since midnight as HH:MM:SS"""
+    return f"{seconds//3600:02d}:{(seconds//60)%60:02d}:{seconds%60:02d}"
 
 def parse_b_record_time(b_record):
     """
     Parse the time from a B record line.
     Format: BHHMMSSLLLLLLLLoooooooA
     Where HHMMSS is the time (hour, minute, second)
+    
+    Returns:
+        int: Seconds since midnight, or None if the time field is invalid
     """
-    if len(b_record) < 7:
+    hhmmss = b_record[1:7]
+    if len(hhmmss) < 6 or not hhmmss.isdigit():
         return None
         
-    try:
-        hour = int(b_record[1:3])
-        minute = int(b_record[3:5])
-        second = int(b_record[5:7])
-        
-        # Create a time object without date (we only care about time intervals)
-        time_obj = timedelta(hours=hour, minutes=minute, seconds=second)
-        return time_obj
-    except (ValueError, IndexError):
-        return None
+    # Parse HHMMSS with a single int conversion instead of one per field
+    value = int(hhmmss)
+    return (value // 10000) * 3600 + (value // 100 % 100) * 60 + value % 100
+
+def _text(value):
+    """Decode a header field from raw bytes and strip surrounding whitespace"""
+    return value.decode('utf-8', errors='replace').strip()
+
+def _parse_fr_type(line, header_info):
+    """Parse the flight recorder type H record (HFFTYFRTYPE)"""
+    parts = line[12:].split(b',')
+    if parts and parts[0].strip():
+        header_info['device_model'] = _text(parts[0])
+
+def _parse_firmware(line, header_info):
+    """Parse the firmware version H record (HFRFWFIRMWAREVERSION)"""
+    parts = line[12:].split(b':')
+    if parts and parts[0].strip():
+        header_info['device_FW'] = _text(parts[1])
+
+def _parse_hardware(line, header_info):
+    """Parse the hardware version H record (HFRHWHARDWAREVERSION)"""
+    parts = line[12:].split(b':')
+    if parts and parts[0].strip():
+        header_info['device_HW'] = _text(parts[1])
+
+def _parse_date(line, header_info):
+    """Parse the flight date H record (HFDTEDATE)"""
+    header_info['dateDD'] = _text(line[10:12])
+    header_info['dateMM'] = _text(line[12:14])
+    header_info['dateYY'] = _text(line[14:])
+
+# Map manufacturer codes to full names (from IGC approval table)
+_MANUFACTURERS = {
+    'ACT': 'Aircotec Flight Instruments',
+    'CAM': 'Cambridge Aero Instruments',
+    'CNI': 'ClearNav Instruments',
+    'DSX': 'DataSwan',
+    'EWA': 'EW Avionics',
+    'FIL': 'Filser',
+    'FLA': 'Flarm Technology GmbH',
+    'XFL': 'Flarm Technology GmbH',
+    'GCS': 'Garrecht Avionik GmbH',
+    'IMI': 'IMI Gliding Equipment',
+    'LGS': 'Logstream SP',
+    'LXN': 'LX Navigation',
+    'LXV': 'LXNAV ',
+    'NAV': 'Naviter',
+    'NKL': 'Nielsen-Kellerman',
+    'NTE': 'New Technologies',
+    'PFE': 'PressFinish Electronics',
+    'RCE': 'RC Electronics',
+    'SCH': 'Scheffel Automation',
+    'SDI': 'Streamline Digital Instruments',
+    'TRI': 'Triadis Engineering GmbH',
+    'ZAN': 'Zander Segelflugrechner'
+}
+
+# H record handlers keyed by the record tag (the part before the colon), so
+# each header line needs a single dict lookup instead of a startswith per tag
+_HEADER_HANDLERS = {
+    b'HFFTYFRTYPE': _parse_fr_type,
+    b'HFRFWFIRMWAREVERSION': _parse_firmware,
+    b'HFRHWHARDWAREVERSION': _parse_hardware,
+    b'HFDTEDATE': _parse_date
+}
 
-def parse_igc_header(file_path):
+def parse_igc_header(lines):
     """
     Parse the header information from an IGC file to extract flight recorder details.
     
@@ -49,6 +115,10 @@ def parse_igc_header(file_path):
     - A record: Flight recorder manufacturer and identification
     - H records: Various header information including FR type, pilot, etc.
     
+    Args:
+        lines: Raw (bytes) lines of the IGC file without line terminators,
+               up to the first B record. Only the extracted fields are decoded.
+        
     Returns:
         dict: A dictionary containing manufacturer, device model and device ID
     """
@@ -63,77 +133,34 @@ def parse_igc_header(file_path):
         'device_HW': 'Unknown'
     }
     
-    try:
-        with open(file_path, 'r', errors='replace') as f:
-            for line in f:
-                line = line.strip()
-                
-                # Parse A record (FR manufacturer and identification)
-                if line.startswith('A'):
-                    if len(line) >= 4:
-                        mfr_code = line[1:4]                        # Map manufacturer codes to full names (from IGC approval table)
-                        manufacturers = {
-                            'ACT': 'Aircotec Flight Instruments',
-                            'CAM': 'Cambridge Aero Instruments',
-                            'CNI': 'ClearNav Instruments',
-                            'DSX': 'DataSwan',
-                            'EWA': 'EW Avionics',
-                            'FIL': 'Filser',
-                            'FLA': 'Flarm Technology GmbH',
-                            'XFL': 'Flarm Technology GmbH',
-                            'GCS': 'Garrecht Avionik GmbH',
-                            'IMI': 'IMI Gliding Equipment',
-                            'LGS': 'Logstream SP',
-                            'LXN': 'LX Navigation',
-                            'LXV': 'LXNAV ',
-                            'NAV': 'Naviter',
-                            'NKL': 'Nielsen-Kellerman',
-                            'NTE': 'New Technologies',
-                            'PFE': 'PressFinish Electronics',
-                            'RCE': 'RC Electronics',
-                            'SCH': 'Scheffel Automation',
-                            'SDI': 'Streamline Digital Instruments',
-                            'TRI': 'Triadis Engineering GmbH',
-                            'ZAN': 'Zander Segelflugrechner'
-                        }
-                        header_info['manufacturer'] = manufacturers.get(mfr_code, mfr_code)
-                        
-                        # Extract device ID if available in the A record
-                        if len(line) > 4:
-                            header_info['device_id'] = line[4:7]
+    # Records still to be seen; stop reading once all of them were parsed
+    pending = {b'A', *_HEADER_HANDLERS}
+    
+    for line in lines:
+        # Parse A record (FR manufacturer and identification)
+        if line.startswith(b'A'):
+            pending.discard(b'A')
+            line = line.rstrip()
+            if len(line) >= 4:
+                mfr_code = line[1:4].decode('utf-8', errors='replace')
+                header_info['manufacturer'] = _MANUFACTURERS.get(mfr_code, mfr_code)
                 
-                # Parse H records for device info
-                if line.startswith('HFFTYFRTYPE:'):
-                    parts = line[12:].split(',')
-                    if parts and parts[0].strip():
-                        header_info['device_model'] = parts[0].strip()
-
-                # Parse H records for device info
-                if line.startswith('HFRFWFIRMWAREVERSION:'):
-                    parts = line[12:].split(':')
-                    if parts and parts[0].strip():
-                        header_info['device_FW'] = parts[1].strip()
-
-                # Parse H records for device info
-                if line.startswith('HFRHWHARDWAREVERSION:'):
-                    parts = line[12:].split(':')
-                    if parts and parts[0].strip():
-                        header_info['device_HW'] = parts[1].strip()
-
-                # Parse H records for device info
-                if line.startswith('HFDTEDATE:'):
-                    #print(line)
-                    header_info['dateDD'] = line[10:12]
-                    header_info['dateMM'] = line[12:14]
-                    header_info['dateYY'] = line[14:]
+                # Extract device ID if available in the A record
+                if len(line) > 4:
+                    header_info['device_id'] = _text(line[4:7])
+        
+        # Parse H records for device info
+        tag, colon, _ = line.partition(b':')
+        handler = _HEADER_HANDLERS.get(tag) if colon else None
+        if handler:
+            handler(line, header_info)
+            pending.discard(tag)
+            
+        # Break after we've read past the header section (when B records start)
+        # or once everything we need has been found
+        if not pending or line.startswith(b'B'):
+            break
 
-                # Break after we've read past the header section (when B records start)
-                if line.startswith('B'):
-                    break
-    
-    except Exception as e:
-        print(f"Error reading header from {file_path}: {e}")
-    
     return header_info
 
 def format_time(seconds):
@@ -148,68 +175,197 @@ def format_time(seconds):
     else:
         return f"{seconds:.1f}s"
 
+def interval_stats(intervals):
+    """
+    Calculate mean, sample standard deviation, min and max of the intervals
+    in a single pass.
+    
+    The intervals are whole seconds, so the sum and the sum of squares are
+    kept as exact ints and the variance is a single correctly rounded
+    division. A standard deviation of exactly 1 stays 1.0, which matters
+    for the "stddev < 1.0" fixed-interval check.
+    
+    >>> interval_stats([1, 1, 1, 2, 2, 1, 2, 4, 1])
+    (1.6666666666666667, 1.0, 1, 4)
+    
+    Args:
+        intervals: Non-empty sequence of intervals in whole seconds
+        
+    Returns:
+        tuple: (mean, stddev, min, max)
+    """
+    n = 0
+    total = 0
+    squares = 0
+    min_interval = math.inf
+    max_interval = -math.inf
+    for x in intervals:
+        n += 1
+        total += x
+        squares += x * x
+        if x < min_interval:
+            min_interval = x
+        if x > max_interval:
+            max_interval = x
+    
+    # Standard deviation is only defined for more than one interval
+    stddev = math.sqrt((n * squares - total * total) / (n * (n - 1))) if n > 1 else 0
+    return total / n, stddev, min_interval, max_interval
+
+def parse_b_record_times(buf, start, stop, eol=b'\n'):
+    """
+    Collect the times of all B records in buf[start:stop].
+    
+    B records have a fixed length within a file (defined by the I record),
+    so once the length of the first record is known the following records
+    are located by offset instead of splitting the buffer into lines.
+    Records interleaved with the fixes that break the stride (E, F, K
+    records) are skipped by resyncing on the next line terminator.
+    
+    Args:
+        buf: bytes-like object (e.g. an mmap) holding the IGC file
+        start: Offset of the first B record
+        stop: Offset where the fix records end (start of the G block)
+        eol: Byte that ends each line (b'\n' for LF/CRLF, b'\r' for CR only)
+        
+    Returns:
+        array: Times of the B records in seconds since midnight ('i' typecode)
+    """
+    times = array('i')
+    eol_byte = eol[0]
+    
+    # Record length of the first B record, including its line terminator
+    line_end = buf.find(eol, start, stop)
+    reclen = (line_end if line_end != -1 else stop) - start + 1
+    
+    append = times.append
+    pos = start
+    while pos < stop:
+        end = pos + reclen
+        if end <= stop and buf[pos] == _B and buf[end - 1] == eol_byte:
+            # Regular B record: validate HHMMSS once and convert it with a
+            # single int() instead of a function call per record
+            hhmmss = buf[pos + 1:pos + 7]
+            if hhmmss.isdigit():
+                value = int(hhmmss)
+                append((value // 10000) * 3600 + (value // 100 % 100) * 60 + value % 100)
+        else:
+            # Not a regular B record; find the end of this line
+            line_end = buf.find(eol, pos, stop)
+            end = line_end + 1 if line_end != -1 else stop
+            if buf[pos] == _B:
+                time = parse_b_record_time(buf[pos:pos + 7])
+                if time is not None:
+                    append(time)
+        pos = end
+    return times
+
 def analyze_igc_file(file_path):
     """
     Analyze an IGC file to determine the logging interval.
     
+    The file is memory mapped and read once: the lines before the first
+    B record are handed to parse_igc_header and the remainder is scanned
+    for B records.
+    
     Args:
         file_path: Path to the IGC file
         
     Returns:
         tuple: (
+            header_info: dict as returned by parse_igc_header,
             is_fixed_interval: bool, 
-            avg_interval_seconds: float, 
-            min_interval_seconds: float, 
-            max_interval_seconds: float, 
-            stddev_seconds: float, 
+            avg_interval_seconds: float (int 0 if there are no intervals), 
+            min_interval_seconds: int, 
+            max_interval_seconds: int, 
+            stddev_seconds: float (int 0 if there are no intervals), 
             total_points: int, 
-            intervals: list of intervals in seconds,
-            timestamp_list: list of timestamps (as timedelta objects)
+            intervals: array of intervals in seconds,
+            timestamp_list: array of timestamps (as seconds since midnight)
         )
+        
+    Raises:
+        OSError, ValueError: If the file cannot be opened or mapped
     """
-    times = []
-    intervals = []
+    header_lines = []
+    times = array('i')
     
-    try:
-        with open(file_path, 'r', errors='replace') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('B'):
-                    time = parse_b_record_time(line)
-                    if time:
-                        times.append(time)
-    except Exception as e:
-        print(f"Error reading file {file_path}: {e}")
-        return False, 0, 0, 0, 0, 0, []
+    with open(file_path, 'rb') as f:
+        # An empty file cannot be memory mapped (and holds nothing anyway)
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Hint that the whole file is about to be read. This is
+                # advisory only; the kernel already reads ahead on the
+                # sequential page faults of the scan
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    try:
+                        mm.madvise(mmap.MADV_WILLNEED)
+                    except OSError:
+                        # Only a hint; some filesystems refuse it
+                        pass
+                
+                # Lines end in LF or CRLF, or in a bare CR in some files
+                eol = b'\n' if mm.find(b'\n') != -1 else b'\r'
+                
+                # The header section ends where the B records start
+                header_end = mm.find(eol + b'B') + 1
+                if mm[:1] == b'B':
+                    header_end = 0
+                elif header_end == 0:
+                    header_end = len(mm)
+                header_lines = mm[:header_end].splitlines()
+                
+                # The security (G) records close the file; the fixes end there
+                g_start = mm.find(eol + b'G', header_end)
+                records_end = g_start + 1 if g_start != -1 else len(mm)
+                
+                times = parse_b_record_times(mm, header_end, records_end, eol)
+    
+    header_info = parse_igc_header(header_lines)
     
     if len(times) < 2:
-        return False, 0, 0, 0, 0, len(times), []
+        return header_info, False, 0, 0, 0, 0, len(times), [], []
     
-    # Calculate intervals between consecutive timestamps
-    for i in range(1, len(times)):
-        # Calculate time difference in seconds
-        diff = (times[i] - times[i-1]).total_seconds()
-        
-        # Only add if positive (handles day crossover more safely)
-        if diff > 0:
-            intervals.append(diff)
+    # Calculate intervals between consecutive timestamps in seconds.
+    # Only keep positive ones (handles day crossover more safely)
+    intervals = array('i', [diff for diff in map(operator.sub, times[1:], times) if diff > 0])
     
     if not intervals:
-        return False, 0, 0, 0, 0, len(times), []
+        return header_info, False, 0, 0, 0, 0, len(times), [], []
     
-    avg_interval = sum(intervals) / len(intervals)
-    min_interval = min(intervals)
-    max_interval = max(intervals)
-    
-    # Calculate standard deviation if we have more than one interval
-    stddev = statistics.stdev(intervals) if len(intervals) > 1 else 0
+    avg_interval, stddev, min_interval, max_interval = interval_stats(intervals)
       # Determine if the interval is fixed (allowing for small variations)
     # Consider interval fixed if standard deviation is less than 1 second
     is_fixed_interval = stddev < 1.0
     
-    return (is_fixed_interval, avg_interval, min_interval, max_interval, 
+    return (header_info, is_fixed_interval, avg_interval, min_interval, max_interval, 
             stddev, len(times), intervals, times)
 
+def find_significant_variations(intervals):
+    """
+    Find the positions where the logging interval changes significantly.
+    
+    An interval change is significant when it differs from the previous
+    interval by more than 50% or 5 seconds (whichever is less).
+    
+    Args:
+        intervals: Sequence of intervals in seconds
+        
+    Returns:
+        list: Indices into intervals where a significant change starts
+    """
+    significant = []
+    prev_interval = intervals[0]
+    for i in range(1, len(intervals)):
+        interval = intervals[i]
+        change_threshold = prev_interval * 0.5
+        if change_threshold > 5.0:
+            change_threshold = 5.0
+        if abs(interval - prev_interval) > change_threshold:
+            significant.append(i)
+        prev_interval = interval
+    return significant
+
 def analyze_directory(dir_path):
     """
     Analyze all IGC files in a directory and report their logging intervals
@@ -220,10 +376,11 @@ def analyze_directory(dir_path):
     print(f"\nAnalyzing IGC files in: {dir_path}\n")
     print("=" * 80)
     
-    # Get all IGC files (case insensitive)
-    igc_files = [f for f in os.listdir(dir_path) 
-                if os.path.isfile(os.path.join(dir_path, f)) 
-                and f.lower().endswith(('.igc', '.IGC'))]
+    # Get all IGC files (case insensitive), sorted by name
+    with os.scandir(dir_path) as it:
+        igc_files = sorted((e for e in it 
+                            if e.is_file() and e.name.lower().endswith('.igc')),
+                           key=lambda e: e.name)
     
     if not igc_files:
         print(f"No IGC files found in {dir_path}")
@@ -231,63 +388,120 @@ def analyze_directory(dir_path):
     
     print(f"Found {len(igc_files)} IGC files\n")
     
-    # Sort files by name
-    igc_files.sort()
-    for filename in igc_files:
-        file_path = os.path.join(dir_path, filename)
-        
-        # Parse the header information first
-        header_info = parse_igc_header(file_path)
+    # Symlinks to a file that is already listed are analyzed only once.
+    # Only symlinks need resolving; a regular entry is its own canonical path
+    real_dir = os.path.realpath(dir_path)
+    keys = [os.path.realpath(e.path) if e.is_symlink() else os.path.join(real_dir, e.name)
+            for e in igc_files]
+    pending = {}
+    for entry, key in zip(igc_files, keys):
+        pending.setdefault(key, entry.path)
+    
+    # Files are independent, so analyze them in parallel worker processes.
+    # A single file is analyzed in-process, since starting the pool would
+    # cost more than it saves. executor.map yields the results in
+    # submission order, keeping the report sorted by file name.
+    analyzed = {}
+    with ExitStack() as stack:
+        if len(pending) > 1:
+            # Imported here: loading the process pool machinery is a
+            # noticeable part of the run time for small directories
+            from concurrent.futures import ProcessPoolExecutor
+            executor = stack.enter_context(ProcessPoolExecutor())
+            results = executor.map(analyze_file, pending.values(), chunksize=4)
+        else:
+            results = map(analyze_file, pending.values())
+        for entry, key in zip(igc_files, keys):
+            if key not in analyzed:
+                analyzed[key] = next(results)
+            print_file_report(entry.name, analyzed[key])
+
+def analyze_file(file_path):
+    """
+    Parse the header and analyze the logging interval of a single IGC file.
+    
+    This usually runs in a worker process, so the result only holds
+    picklable primitives rather than the full interval and timestamp lists.
+    
+    Args:
+        file_path: Path to the IGC file
         
-        # Analyze the file
-        (is_fixed, avg_interval, min_interval, max_interval, 
+    Returns:
+        tuple: (
+            header_info: dict,
+            is_fixed_interval: bool,
+            min_interval_seconds: int,
+            max_interval_seconds: int,
+            total_points: int,
+            variations: up to 5 (start_time, end_time, prev_interval, interval)
+                        tuples, times in seconds since midnight,
+            variation_count: int,
+            error: error message if the file could not be read, else None
+        )
+    """
+    # Parse the header and analyze the file in a single read. Errors are
+    # returned rather than printed, so they show up in the ordered report
+    try:
+        (header_info, is_fixed, avg_interval, min_interval, max_interval, 
          stddev, total_points, intervals, times) = analyze_igc_file(file_path)
-        
-        print(f"File: {filename}, date: {header_info['dateYY']}-{header_info['dateMM']}-{header_info['dateDD']}")
-        print(f"  Flight Recorder: {header_info['manufacturer']}, {header_info['device_model']}, {header_info['device_id']}")
-        print(f"  Firmware: {header_info['device_FW']}")
-        print(f"  Hardware: {header_info['device_HW']}")
-        print(f"  Points logged: {total_points}")
-        
-        if total_points < 2:
-            print("  Not enough points to determine interval")
-            print("-" * 80)
-            continue
+    except Exception as e:
+        return (parse_igc_header([]), False, 0, 0, 0, [], 0, 
+                f"Error reading file {file_path}: {e}")
+    
+    variations = []
+    variation_count = 0
+    if not is_fixed and len(intervals) > 2 and len(times) > 1:
+        significant_variations = find_significant_variations(intervals)
+        variation_count = len(significant_variations)
+        for i in significant_variations[:5]:  # Keep up to 5 changes
+            variations.append((times[i-1], times[i], intervals[i-1], intervals[i]))
+    
+    return (header_info, is_fixed, min_interval, max_interval, 
+            total_points, variations, variation_count, None)
+
+def print_file_report(filename, result):
+    """
+    Print the analysis report of a single IGC file
+    
+    The report is assembled in memory and written to stdout in one go,
+    instead of one write per line.
+    
+    Args:
+        filename: Name of the IGC file
+        result: Tuple returned by analyze_file
+    """
+    (header_info, is_fixed, min_interval, max_interval, 
+     total_points, variations, variation_count, error) = result
+    
+    out = io.StringIO()
+    if error:
+        print(error, file=out)
+    print(f"File: {filename}, date: {header_info['dateYY']}-{header_info['dateMM']}-{header_info['dateDD']}", file=out)
+    print(f"  Flight Recorder: {header_info['manufacturer']}, {header_info['device_model']}, {header_info['device_id']}", file=out)
+    print(f"  Firmware: {header_info['device_FW']}", file=out)
+    print(f"  Hardware: {header_info['device_HW']}", file=out)
+    print(f"  Points logged: {total_points}", file=out)
+    
+    #print(f"  Average interval: {format_time(avg_interval)}")
+    if total_points < 2:
+        print("  Not enough points to determine interval", file=out)
+    elif is_fixed:
+        print(f"  Interval type: FIXED", file=out)
+    else:
+        print(f"  Interval type: VARIABLE", file=out)
+        print(f"  Min interval: {format_time(min_interval)}", file=out)
+        print(f"  Max interval: {format_time(max_interval)}", file=out)
+        # Show significant variations
+        if variations:
+            print("\n  Significant interval changes:", file=out)
+            for prev_time, current_time, prev, current in variations:
+                print(f"    {format_hms(prev_time)}-{format_hms(current_time)}: {format_time(prev)} → {format_time(current)}", file=out)
             
-        #print(f"  Average interval: {format_time(avg_interval)}")
-        if is_fixed:
-            print(f"  Interval type: FIXED")
-        else:
-            print(f"  Interval type: VARIABLE")
-            print(f"  Min interval: {format_time(min_interval)}")
-            print(f"  Max interval: {format_time(max_interval)}")
-              # Find significant variations
-            if len(intervals) > 2 and 'times' in locals() and len(times) > 1:
-                significant_variations = []
-                prev_interval = intervals[0]
-                prev_time = times[0]
-                
-                for i, interval in enumerate(intervals[1:], 1):
-                    # If interval changes by more than 50% or 5 seconds (whichever is less)
-                    change_threshold = min(prev_interval * 0.5, 5.0)
-                    if abs(interval - prev_interval) > change_threshold and i < len(times):
-                        current_time = times[i] if i < len(times) else times[-1]
-                        significant_variations.append((i, prev_time, current_time, prev_interval, interval))
-                    prev_interval = interval
-                    if i < len(times):
-                        prev_time = times[i]
-                
-                if significant_variations:
-                    print("\n  Significant interval changes:")
-                    for i, prev_time, current_time, prev, current in significant_variations[:5]:  # Show up to 5 changes
-                        prev_time_str = f"{prev_time.seconds//3600:02d}:{(prev_time.seconds//60)%60:02d}:{prev_time.seconds%60:02d}"
-                        curr_time_str = f"{current_time.seconds//3600:02d}:{(current_time.seconds//60)%60:02d}:{current_time.seconds%60:02d}"
-                        print(f"    {prev_time_str}-{curr_time_str}: {format_time(prev)} → {format_time(current)}")
-                    
-                    if len(significant_variations) > 5:
-                        print(f"    ... and {len(significant_variations) - 5} more changes")
-        
-        print("-" * 80)
+            if variation_count > 5:
+                print(f"    ... and {variation_count - 5} more changes", file=out)
+    
+    print("-" * 80, file=out)
+    sys.stdout.write(out.getvalue())
 
 def main():
     parser = argparse.ArgumentParser(
@@ -316,8 +530,8 @@ def main():
     analyze_directory(dir_path)
     
     # Check if user wants to analyze subdirectories
-    subdirs = [d for d in os.listdir(dir_path) 
-              if os.path.isdir(os.path.join(dir_path, d))]
+    with os.scandir(dir_path) as it:
+        subdirs = [e.path for e in it if e.is_dir()]
                 
     print("\nAnalysis complete!")
     sys.exit(0)